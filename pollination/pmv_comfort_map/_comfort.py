@@ -132,7 +132,7 @@ class ComfortMappingEntryPoint(DAG):
         default='write-op-map'
     )
 
-    @task(template=LongwaveMrtMap)
+    @task(template=LongwaveMrtMap, annotations={'pool': 'cpu_large'})
     def create_longwave_mrt_map(
         self,
         result_sql=result_sql,
@@ -150,7 +150,7 @@ class ComfortMappingEntryPoint(DAG):
             }
         ]
 
-    @task(template=ShortwaveMrtMap)
+    @task(template=ShortwaveMrtMap, annotations={'pool': 'cpu_large'})
     def create_shortwave_mrt_map(
         self,
         epw=epw,
@@ -172,7 +172,7 @@ class ComfortMappingEntryPoint(DAG):
             }
         ]
 
-    @task(template=AirMap)
+    @task(template=AirMap, annotations={'pool': 'cpu_large'})
     def create_air_temperature_map(
         self,
         result_sql=result_sql,
@@ -189,7 +189,7 @@ class ComfortMappingEntryPoint(DAG):
             }
         ]
 
-    @task(template=AirMap)
+    @task(template=AirMap, annotations={'pool': 'cpu_large'})
     def create_rel_humidity_map(
         self,
         result_sql=result_sql,
@@ -206,7 +206,7 @@ class ComfortMappingEntryPoint(DAG):
             }
         ]
 
-    @task(template=AirSpeedJson)
+    @task(template=AirSpeedJson, annotations={'pool': 'cpu_large'})
     def create_air_speed_json(
         self, epw=epw, enclosure_info=enclosure_info, multiply_by=0.5,
         indoor_air_speed=air_speed, run_period=run_period, name=grid_name
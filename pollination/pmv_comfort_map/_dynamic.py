@@ -2,8 +2,6 @@ from pollination_dsl.dag import Inputs, DAG, task
 from dataclasses import dataclass
 from typing import Dict, List
 
-from pollination.path.read import ReadJSONList
-
 from ._radcontrib import RadianceContribEntryPoint
 
 
@@ -46,8 +44,9 @@ class DynamicContributionEntryPoint(DAG):
         description='A folder containing all of the split sensor grids in the model.'
     )
 
-    sensor_grids = Inputs.file(
-        description='A JSON file with information about sensor grids to loop over.'
+    sensor_grids = Inputs.list(
+        description='A list with information about sensor grids to loop over.',
+        items_type='JSONObject'
     )
 
     sky_dome = Inputs.file(
@@ -71,19 +70,9 @@ class DynamicContributionEntryPoint(DAG):
         'input irradiance files.'
     )
 
-    @task(template=ReadJSONList)
-    def read_grids(self, src=sensor_grids) -> List[Dict]:
-        return [
-            {
-                'from': ReadJSONList()._outputs.data,
-                'description': 'Sensor grids information.'
-            }
-        ]
-
     @task(
         template=RadianceContribEntryPoint,
-        needs=[read_grids],
-        loop=read_grids._outputs.data,
+        loop=sensor_grids,
         sub_folder='shortwave',
         sub_paths={
             'sensor_grid': '{{item.full_id}}.pts',
@@ -517,7 +517,7 @@ class PmvComfortMapEntryPoint(DAG):
         octree_file_with_suns=create_shade_trans_octrees._outputs.scene_folder,
         group_name='{{item.identifier}}',
         sensor_grid_folder='radiance/shortwave/grids',
-        sensor_grids=split_grid_folder._outputs.sensor_grids_file,
+        sensor_grids=split_grid_folder._outputs.sensor_grids,
         sky_dome=create_sky_dome._outputs.sky_dome,
         sky_matrix=create_total_sky._outputs.sky_matrix,
         sky_matrix_direct=create_direct_sky._outputs.sky_matrix,
@@ -551,7 +551,7 @@ class PmvComfortMapEntryPoint(DAG):
         octree_file_with_suns=create_dynamic_octrees._outputs.scene_folder,
         group_name='{{item.identifier}}',
         sensor_grid_folder='radiance/shortwave/grids',
-        sensor_grids=split_grid_folder._outputs.sensor_grids_file,
+        sensor_grids=split_grid_folder._outputs.sensor_grids,
         sky_dome=create_sky_dome._outputs.sky_dome,
         sky_matrix=create_total_sky._outputs.sky_matrix,
         sky_matrix_direct=create_direct_sky._outputs.sky_matrix,
@@ -576,7 +576,8 @@ class PmvComfortMapEntryPoint(DAG):
             'indirect_irradiance': '{{item.full_id}}.ill',
             'direct_irradiance': '{{item.full_id}}.ill',
             'ref_irradiance': '{{item.full_id}}.ill'
-        }
+        },
+        annotations={'pool': 'comfort_maps', 'pool_slots': 1}
     )
     def run_comfort_map(
         self,